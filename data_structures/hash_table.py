@@ -8,7 +8,6 @@ __since__ = '07/02/2023'
 
 
 from typing import TypeVar, Generic
-from data_structures.referential_array import ArrayR
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -41,7 +40,7 @@ class LinearProbeTable(Generic[K, V]):
         if sizes is not None:
             self.TABLE_SIZES = sizes
         self.size_index = 0
-        self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
+        self.array: list[tuple[K, V]|None] = [None] * self.TABLE_SIZES[self.size_index]
         self.count = 0
 
     def hash(self, key: K) -> int:
@@ -79,19 +78,24 @@ class LinearProbeTable(Generic[K, V]):
         """
         # Initial position
         position = self.hash(key)
+        array = self.array
+        table_size = self.table_size
 
-        for _ in range(self.table_size):
-            if self.array[position] is None:
+        for _ in range(table_size):
+            item = array[position]
+            if item is None:
                 # Empty spot. Am I upserting or retrieving?
                 if is_insert:
                     return position
                 else:
                     raise KeyError(key)
-            elif self.array[position][0] == key:
+            elif item[0] == key:
                 return position
             else:
-                # Taken by something else. Time to linear probe.
-                position = (position + 1) % self.table_size
+                # Taken by something else. Time to linear probe, wrapping without a modulo.
+                position += 1
+                if position == table_size:
+                    position = 0
 
         if is_insert:
             raise FullError("Table is full!")
@@ -154,14 +158,26 @@ class LinearProbeTable(Generic[K, V]):
         """
 
         position = self._linear_probe(key, True)
+        self._set_at(position, key, data)
 
-        if self.array[position] is None:
+    def _set_at(self, position: int, key: K, data: V) -> bool:
+        """
+        Set a (key, value) pair at a position already found by _linear_probe,
+        so callers that have probed do not have to probe again.
+
+        :complexity: O(1), plus a rehash when the table grows.
+        :returns: whether the key was already in the table.
+        :raises FullError: when the table cannot be resized further.
+        """
+        existed = self.array[position] is not None
+        if not existed:
             self.count += 1
 
         self.array[position] = (key, data)
 
         if len(self) > self.table_size / 2:
             self._rehash()
+        return existed
 
     def __delitem__(self, key: K) -> None:
         """
@@ -176,14 +192,19 @@ class LinearProbeTable(Generic[K, V]):
         self.array[position] = None
         self.count -= 1
         # Start moving over the cluster
-        position = (position + 1) % self.table_size
+        table_size = self.table_size
+        position += 1
+        if position == table_size:
+            position = 0
         while self.array[position] is not None:
             key2, value = self.array[position]
             self.array[position] = None
             # Reinsert.
             newpos = self._linear_probe(key2, True)
             self.array[newpos] = (key2, value)
-            position = (position + 1) % self.table_size
+            position += 1
+            if position == table_size:
+                position = 0
 
     def is_empty(self) -> bool:
         return self.count == 0
@@ -204,7 +225,7 @@ class LinearProbeTable(Generic[K, V]):
         if self.size_index == len(self.TABLE_SIZES):
             # Cannot be resized further.
             return
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
+        self.array = [None] * self.TABLE_SIZES[self.size_index]
         self.count = 0
         for item in old_array:
             if item is not None:
@@ -1,13 +1,32 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar, Iterator
+import sys
+from typing import Generic, TypeVar, Iterator, Iterable
 from data_structures.hash_table import LinearProbeTable, FullError
-from data_structures.referential_array import ArrayR
 
 K1 = TypeVar('K1')
 K2 = TypeVar('K2')
 V = TypeVar('V')
 
+#marks a top level slot whose key was deleted, probes have to continue past it
+TOMBSTONE = object()
+
+class _Hash2Binder:
+    """
+    Hash function given to each internal table. Forwards to hash2 of the owning
+    DoubleKeyTable with the internal table itself, so the hash stays correct when
+    the internal table is moved to a different top level slot.
+    """
+
+    __slots__ = ('table', 'sub_table')
+
+    def __init__(self, table: DoubleKeyTable, sub_table: LinearProbeTable) -> None:
+        self.table = table
+        self.sub_table = sub_table
+
+    def __call__(self, key: K2) -> int:
+        return self.table.hash2(key, self.sub_table)
+
 class DoubleKeyTable(Generic[K1, K2, V]):
     """
     Double Hash Table.
@@ -31,6 +50,7 @@ class DoubleKeyTable(Generic[K1, K2, V]):
     -values: returns values in table
     -__contains__: checks if table contains a value
     -__setitem__: sets two keys equal to a value
+    -update: sets many key pairs at once
     -__delitem__: deletes item from table
     -rehash: increases size of top array of table and reinserts values
     -__len__: returns number of items in table
@@ -40,8 +60,6 @@ class DoubleKeyTable(Generic[K1, K2, V]):
     # No test case should exceed 1 million entries.
     TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
 
-    HASH_BASE = 31
-
     def __init__(self, sizes:list|None=None, internal_sizes:list|None=None) -> None:
         """
         __init__ function determines the sizes of the top array and internal hash tables
@@ -80,39 +98,32 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         #create and set variables needed by the class
         self.length = 0
         self.top_length = 0
+        self.tombstone_count = 0
         self.top_table_sizes_index = 0
-        self.table_pos = 1
-        self.key_pos = 0
-        #create the top array
-        self.top_array: ArrayR[K1, LinearProbeTable[K2, V]] = ArrayR(self.top_table_sizes[self.top_table_sizes_index])
+        #create the top arrays, keys and their internal tables are stored in parallel
+        #so probing only has to read the keys
+        self.top_keys: list[K1|None] = [None] * self.top_table_sizes[self.top_table_sizes_index]
+        self.top_tables: list[LinearProbeTable[K2, V]|None] = [None] * self.top_table_sizes[self.top_table_sizes_index]
 
 
     def hash1(self, key: K1) -> int:
         """
         Hash the 1st key for insert/retrieve/update into the hashtable.
 
-        :complexity: O(len(key))
+        Uses Python's built in hash, which is computed in C and cached on
+        string objects after the first call.
+
+        :complexity: O(len(key)) the first time a string is hashed, O(1) after.
         """
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+        return hash(key) % self.table_size
 
     def hash2(self, key: K2, sub_table: LinearProbeTable[K2, V]) -> int:
         """
         Hash the 2nd key for insert/retrieve/update into the hashtable.
 
-        :complexity: O(len(key))
+        :complexity: O(len(key)) the first time a string is hashed, O(1) after.
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % sub_table.table_size
-            a = a * self.HASH_BASE % (sub_table.table_size - 1)
-        return value
+        return hash(key) % sub_table.table_size
 
     def _linear_probe(self, key1: K1, key2: K2, is_insert: bool) -> tuple[int, int]:
         """
@@ -129,13 +140,13 @@ class DoubleKeyTable(Generic[K1, K2, V]):
             -top_position: position for top level key
             -internal_position: position for low level key
         Complexity:
-            -Worst case: O(has1(key1)) + O(len(self.top_array) * comp(K)) + O(LinearProbeTable._linear_probe(key2))
+            -Worst case: O(has1(key1)) + O(len(self.top_keys) * comp(K)) + O(LinearProbeTable._linear_probe(key2))
                 - in the worst case the function has call the hash1 function then go around the for loop
-                  len(self.top_array) times and then has to call the LinearProbeTable _linear_probe
+                  len(self.top_keys) times and then has to call the LinearProbeTable _linear_probe
                   function. This means that the worst case complexity is
-                  O(has1(key1)) + O(len(self.top_array) * comp(P)) + O(LinearProbeTable._linear_probe(key2))
+                  O(has1(key1)) + O(len(self.top_keys) * comp(P)) + O(LinearProbeTable._linear_probe(key2))
                   which is equal to
-                  O(hash1(key1) + O(len(self.top_array) * comp(P)) + O(hash2(key2) + N*comp(K)) where N
+                  O(hash1(key1) + O(len(self.top_keys) * comp(P)) + O(hash2(key2) + N*comp(K)) where N
                   is the length of the internal table.
             -Best case: O(hash1(key1) + O(comp(P)) + O(hash2(key2) + comp(K))
                 - in the best case the for loop only has to go around once and the _linear_probe function
@@ -144,29 +155,74 @@ class DoubleKeyTable(Generic[K1, K2, V]):
                   or
                   O(hash1(key1) + O(comp(P)) + O(hash2(key2) + comp(K))
         """
-        #get top position
-        top_position = self.hash1(key1)
+        return self._linear_probe_h(key1, self.hash1(key1), key2, is_insert)
 
-        for _ in range(len(self.top_array)):
+    def _linear_probe_h(self, key1: K1, top_hash: int, key2: K2, is_insert: bool) -> tuple[int, int]:
+        """
+        _linear_probe_h is _linear_probe with the hash of key1 already computed.
+        Args:
+            -key1: top level key position to be found
+            -top_hash: hash1 of key1
+            -key2: lower level key position to be found
+            -is_insert: if the keys are being inserted
+        Raises:
+            -KeyError: When the key pair is not in the table, but is_insert is False.
+            -FullError: When a table is full and a key cannot be inserted.
+        Returns:
+            -top_position: position for top level key
+            -internal_position: position for low level key
+        Complexity:
+            -Worst case: O(len(self.top_keys) * comp(K)) + O(LinearProbeTable._linear_probe(key2))
+                - same as _linear_probe without the cost of hashing key1.
+            -Best case: O(comp(K)) + O(LinearProbeTable._linear_probe(key2))
+                - same as _linear_probe without the cost of hashing key1.
+        """
+        #get top position
+        top_position = top_hash
+        #bind the arrays once so the loop only reads locals
+        top_keys = self.top_keys
+        top_tables = self.top_tables
+        table_size = len(top_keys)
+        #first deleted slot passed, an insert reuses it once key1 is known to be absent
+        free_position = None
+
+        for _ in range(table_size):
+            top_key = top_keys[top_position]
             #if position is empty return position if is insert is true else raise KeyError
-            if self.top_array[top_position] is None:
+            if top_key is None:
                 if is_insert:
-                    self.top_array[top_position] = (key1, LinearProbeTable(self.internal_table_sizes))
-                    self.top_array[top_position][self.table_pos].hash = lambda k: self.hash2(k, self.top_array[top_position][self.table_pos])
-                    internal_position = self.top_array[top_position][self.table_pos]._linear_probe(key2, is_insert)
-                    return top_position, internal_position
+                    if free_position is None:
+                        free_position = top_position
+                    break
                 else:
                     raise KeyError()
+            #deleted slot, the key may still be further along the cluster
+            elif top_key is TOMBSTONE:
+                if free_position is None:
+                    free_position = top_position
             #if position already has key set key to new value
-            elif self.top_array[top_position][self.key_pos] == key1:
-                internal_position = self.top_array[top_position][self.table_pos]._linear_probe(key2, is_insert)
+            #identity check first, interned keys never need the full comparison
+            elif top_key is key1 or top_key == key1:
+                internal_position = top_tables[top_position]._linear_probe(key2, is_insert)
                 return top_position, internal_position
-            else:
-                top_position = (top_position + 1) % self.table_size
-        if is_insert:
-            raise FullError()
-        else:
+            #step to the next slot, wrapping without a modulo
+            top_position += 1
+            if top_position == table_size:
+                top_position = 0
+        if not is_insert:
             raise KeyError()
+        if free_position is None:
+            raise FullError()
+        #key1 is new, give it an internal table in the first free slot
+        if top_keys[free_position] is TOMBSTONE:
+            self.tombstone_count -= 1
+        sub_table = LinearProbeTable(self.internal_table_sizes)
+        sub_table.hash = _Hash2Binder(self, sub_table)
+        top_keys[free_position] = key1
+        top_tables[free_position] = sub_table
+        self.top_length += 1
+        internal_position = sub_table._linear_probe(key2, is_insert)
+        return free_position, internal_position
 
 
 
@@ -174,8 +230,7 @@ class DoubleKeyTable(Generic[K1, K2, V]):
 
     def iter_keys(self, key:K1|None=None) -> Iterator[K1|K2]:
         """
-        __iter_keys__ function creates and returns a instance of the
-        DoubleKeyKeyIterator class.
+        iter_keys function is a generator that goes through the keys in the table.
         Args:
             -key: if top level key is entered bottom level keys
                   associated with the key are returned else all
@@ -183,117 +238,31 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         Raises:
             -None: Function raises no errors
         Returns:
-            -Iterator[K1|K2]: Function retuens a DoubleKeyKeyIterator
+            -Iterator[K1|K2]: Function returns a generator over the keys
         Complexity:
-            -Worst case: O(1)
-                - function creates a instance of the DoubleKeyKeyIterator which
-                  is constant since the __init__ function in the
-                  DoubleKeyKeyIterator is constant.
-            -Best case: O(1)
-                - worst case is constant which is the best possible case so best case is constant.
+            -Worst case: O(len(self.top_keys) * comp(K1)) + O(len(LinearProbeTable))
+                - when a key is entered the top array has to be searched for the key
+                  and then every slot of its internal table has to be visited.
+            -Best case: O(len(self.top_keys))
+                - when no key is entered every slot of the top array is visited once.
         """
-        class DoubleKeyKeyIterator(Generic[K1, K2, V]):
-            """
-            DoubleKeyKeyIterator is a class that returns a iterator that is able
-            to iterate though the keys in a DoubleKeyTable.
-            __init__: creates variables needed by the class
-            __iter__: returns instance of the class
-            __next__: returns next value in the iteration
-            """
-            def __init__(self, table: DoubleKeyTable, key: K1 | None):
-                """
-                 __init__ function creates variables needed by the class
-                Args:
-                    -DoubleKeyTable: DoubleKeyTable being iterated though
-                    -key: if top level key is entered bottom level keys
-                          associated with the key are returned else all
-                          else in the table are returned
-                Raises:
-                    -None: Function raises no errors
-                Returns:
-                    -None: Function does not return a value
-                Complexity:
-                    -Worst case: O(1)
-                        - all operations are constant so worst case complexity is O(1)
-                    -Best case: O(1)
-                        - worst case is constant which is the best possible case so best case is constant.
-                """
-                self.table = table
-                self.key = key
-                self.index = 0
-                self.position = None
-
-            def __iter__(self):
-                """
-                __iter__ function returns a instance of the class.
-                Args:
-                    -None: Function takes no arguments
-                Raises:
-                    -None: Function raises no errors
-                Returns:
-                    -None: Function does not return a value
-                Complexity:
-                    -Worst case: O(1)
-                        - all operations are constant so worst case complexity is O(1)
-                    -Best case: O(1)
-                        - worst case is constant which is the best possible case so best case is constant.
-                """
-                return self
-
-            def __next__(self) -> [K1 | K2]:
-                """
-                __next__ function returns the next value in the iteration
-                Args:
-                    -None: Function takes no arguments
-                Raises:
-                    -StopIteration: StopIteration is raised when there are no more keys
-                                    to be iterated though
-                Returns:
-                    -[K1|K2]: Function returns the next key in the iteration
-                Complexity:
-                    -Worst case: O(len(self.top_array) * comp(T)) + O(len(LinearProbeTable) * comp(K))
-                        - In the worst case the function enters the elif and the function has to go tough all
-                          the keys in the top array and perform a comparison and them has to go through all the
-                          keys in the LinearProbeTable stored in the array and perform a comparison. This
-                          makes the worst case complexity
-                          O(len(self.top_array) * comp(T)) + O(len(LinearProbeTable) * comp(K))
-                    -Best case: O(len(self.top_array) * comp(T))
-                        - In the best case either if statement can be entered and if the table is empty the function
-                          will iterate though the top array and perform a comparison and stop giving the function
-                          a best case complexity O(len(self.top_array) * comp(T))
-                        """
-                if self.key is None:
-                    #return the top level keys in the table
-                    while True:
-                        if self.index <= len(self.table.top_array) and self.table.top_array[self.index] is not None:
-                            return self.table.top_array[self.index][0]
-                        elif self.index < len(self.table.top_array):
-                            self.index += 1
-                        else:
-                            raise StopIteration
-
-                elif self.key is not None:
-                    #get position of top key
-                    if self.position is None:
-                        for space in range(len(self.table.top_array)):
-                            if self.table.top_array[space] == self.key:
-                                self.position = space
-                            elif space == len(self.table.top_array):
-                                raise StopIteration
-                    #return bottom level key corrosponding to top level key
-                    while True:
-                        if self.index <= len(self.table.top_array[self.position][1].array) and \
-                                self.table.top_array[self.position][1].array[self.index] is not None:
-                            print(self.table.top_array[self.position][1].array[self.index][0])
-                            return self.table.top_array[self.position][1].array[self.index][0]
-                        elif self.index < len(self.table.top_array[self.position][1].array):
-                            self.index += 1
-                        else:
-                            raise StopIteration
-
-        #create and return a instance of the DoubleKeyKeyIterator
-        return DoubleKeyKeyIterator(self, key)
-
+        top_keys = self.top_keys
+        if key is None:
+            #return the top level keys in the table
+            for space in range(len(top_keys)):
+                top_key = top_keys[space]
+                if top_key is not None and top_key is not TOMBSTONE:
+                    yield top_key
+        else:
+            #return bottom level keys corrosponding to top level key
+            for space in range(len(top_keys)):
+                if top_keys[space] == key:
+                    inner = self.top_tables[space].array
+                    for in_space in range(len(inner)):
+                        item = inner[in_space]
+                        if item is not None:
+                            yield item[0]
+                    return
 
     def keys(self, key:K1|None=None) -> list[K1]:
         """
@@ -312,31 +281,37 @@ class DoubleKeyTable(Generic[K1, K2, V]):
                 - in the worst case the function goes through the second for loop
                   and class the keys() function from LinearProbeTable once which
                   gives the function a worst case complexity of
-                  O(len(self.top_array)) * O(LinearProbeTable.keys())
+                  O(len(self.top_keys)) * O(LinearProbeTable.keys())
 
-            -Best case: O(len(self.top_array)) + O(LinearProbeTable.keys())
+            -Best case: O(len(self.top_keys)) + O(LinearProbeTable.keys())
                 - in the best case the first for loop is entered and the function
                   adds a key to the list giving the function a complexity of
-                  O(len(self.top_array)) or the first second for loop is
+                  O(len(self.top_keys)) or the first second for loop is
                   entered and the table is found on the first try so the complexity
                   of the function is O(LinearProbeTable.keys()) so over all the best
                   case complxity of the function is
-                  O(len(self.top_array)) + O(LinearProbeTable.keys())
+                  O(len(self.top_keys)) + O(LinearProbeTable.keys())
         """
 
         keys = []
 
         if key is None:
-            #get top level keys
-            for space in range(len(self.top_array)):
-                if self.top_array[space] is not None:
-                    keys.append(self.top_array[space][self.key_pos])
+            #get top level keys, writing into a list of the known final size
+            keys = [None] * self.top_length
+            count = 0
+            top_keys = self.top_keys
+            for space in range(len(top_keys)):
+                top_key = top_keys[space]
+                if top_key is not None and top_key is not TOMBSTONE:
+                    keys[count] = top_key
+                    count += 1
             return keys
             #get bottom level keys corosponding to key
         elif key is not None:
-            for space in range(len(self.top_array)):
-                if self.top_array[space] is not None and self.top_array[space][self.key_pos] == key:
-                    keys = self.top_array[space][self.table_pos].keys()
+            top_keys = self.top_keys
+            for space in range(len(top_keys)):
+                if top_keys[space] == key:
+                    keys = self.top_tables[space].keys()
                     return keys
 
 
@@ -347,8 +322,7 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         key = k:
             Returns an iterator of all values in the bottom-hash-table for k.
 
-        iter_values function creates and returns a instance of the
-        DoubleKeyValueIterator class.
+        iter_values function is a generator that goes through the values in the table.
         Args:
             -key: if key is None the function returns all values in the table
                   else if a key is entered the function returns all to values
@@ -356,114 +330,24 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         Raises:
             -None: Function raises no errors
         Returns:
-            -None: Function does not return a value
+            -Iterator[V]: Function returns a generator over the values
         Complexity:
-            -Worst case: O(1)
-                - creating and returning a instance of the DoubleKeyValuesIterator
-                  is constant so the function is constant.
-            -Best case: O(1)
-                - worst case is constant which is the best possible case so best case is constant.
+            -Worst case: O(len(self.top_keys) * len(LinearProbeTable))
+                - when no key is entered every slot of every internal table is visited.
+            -Best case: O(len(self.top_keys))
+                - the table is empty so only the top array is visited.
         """
-        class DoubleKeyValuesIterator(Generic[K1, K2, V]):
-            def __init__(self, table: DoubleKeyTable, key: K1 | None):
-                """
-                 __init__ function creates variables needed by the class
-                Args:
-                    -DoubleKeyTable: DoubleKeyTable being iterated though
-                    -key: if top level key is entered values corresponding to
-                          key are returned else all values in hash table are
-                          returned.
-                Raises:
-                    -None: Function raises no errors
-                Returns:
-                    -None: Function does not return a value
-                Complexity:
-                    -Worst case: O(1)
-                        - all operations are constant so worst case complexity is O(1)
-                    -Best case: O(1)
-                        - worst case is constant which is the best possible case so best case is constant.
-                """
-                self.table = table
-                self.key = key
-                self.index = 0
-                self.in_index = 0
-                self.position = None
-
-            def __iter__(self):
-                """
-                __iter__ function returns a instance of the class.
-                Args:
-                    -None: Function takes no arguments
-                Raises:
-                    -None: Function raises no errors
-                Returns:
-                    -None: Function does not return a value
-                Complexity:
-                    -Worst case: O(1)
-                        - all operations are constant so worst case complexity is O(1)
-                    -Best case: O(1)
-                        - worst case is constant which is the best possible case so best case is constant.
-                """
-                return self
-
-            def __next__(self) -> [K1 | K2]:
-                """
-                __next__ function returns the next value in the iteration
-                Args:
-                    -None: Function takes no arguments
-                Raises:
-                    -StopIteration: StopIteration is raised when there are no more values
-                                    to be iterated though
-                Returns:
-                    -[K1|K2]: Function returns the next key in the iteration
-                Complexity:
-                    -Worst case: O(len(self.top_array) * comp(T)) + O(len(LinearProbeTable) * comp(K))
-                        - In the worst case the function enters the elif and the function has to go tough all
-                          the keys in the top array and perform a comparison and them has to go through all the
-                          values in the LinearProbeTable stored in the array and perform a comparison. This
-                          makes the worst case complexity
-                          O(len(self.top_array) * comp(T)) + O(len(LinearProbeTable) * comp(K))
-                    -Best case: O(len(self.top_array) * comp(T))
-                        - In the best case either if statement can be entered and if the table is empty the function
-                          will iterate though the top array and perform a comparison and stop giving the function
-                          a best case complexity O(len(self.top_array) * comp(T))
-                        """
-                if self.key is None:
-                    #get value in lower hash table
-                    while True:
-                        if self.index <= len(self.table.top_array) and self.table.top_array[self.index] is not None:
-                            if self.in_index <= len(self.table.top_array[self.index][1].array) and \
-                                    self.table.top_array[self.index][1].array[self.in_index] is not None:
-                                return self.table.top_array[self.index][1].array[self.in_index][1]
-                            else:
-                                self.in_index += 1
-                        elif self.index < len(self.table.top_array):
-                            self.index += 1
-                            self.in_index = 0
-                        else:
-                            raise StopIteration
-
-                elif self.key is not None:
-                    #get position of top key
-                    if self.position is None:
-                        for space in range(len(self.table.top_array)):
-                            if self.table.top_array[space] == self.key:
-                                self.position = space
-                            elif space == len(self.table.top_array):
-                                raise StopIteration
-                    #return value corrosponding to top level key
-                    while True:
-                        if self.index <= len(self.table.top_array[self.position][1].array) and \
-                                self.table.top_array[self.position][1].array[self.index] is not None:
-                            return self.table.top_array[self.position][1].array[self.index][1]
-                        elif self.index < len(self.table.top_array[self.position][1].array):
-                            self.index += 1
-                        else:
-                            raise StopIteration
-
-        #return instance of DoubleKeyValuesIterator
-        return DoubleKeyValuesIterator(self, key)
-
+        top_keys = self.top_keys
+        for space in range(len(top_keys)):
+            top_key = top_keys[space]
+            if top_key is not None and top_key is not TOMBSTONE and (key is None or top_key == key):
+                inner = self.top_tables[space].array
+                for in_space in range(len(inner)):
+                    item = inner[in_space]
+                    if item is not None:
+                        yield item[1]
+                if key is not None:
+                    return
 
     def values(self, key:K1|None=None) -> list[V]:
         """
@@ -479,36 +363,47 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         Returns:
             -values: Function returns a list of values from the table
         Complexity:
-            -Worst case: O(len(self.top_array)) * O(LinearProbeTable.__getitem__()) + O(LinearProbeTable.values())
+            -Worst case: O(len(self.top_keys)) * O(LinearProbeTable.__getitem__()) + O(LinearProbeTable.values())
                 - In the worst case a key is entered which means the second for loop will
-                  go around len(self.top_array) times and each time it will call the
+                  go around len(self.top_keys) times and each time it will call the
                   __getitem__ function in LinearProbeTable and it will call the values
                   function from LinearProbeTable once when it has found the correct table.
                   This makes the worst case complexity of the function
-                  O(len(self.top_array)) * O(LinearProbeTable.__getitem__()) + O(LinearProbeTable.values())
-            -Best case: O(len(self.top_array)) * O(LinearProbeTable.values()) + O(LinearProbeTable.values())
+                  O(len(self.top_keys)) * O(LinearProbeTable.__getitem__()) + O(LinearProbeTable.values())
+            -Best case: O(len(self.top_keys)) * O(LinearProbeTable.values()) + O(LinearProbeTable.values())
                 - In the best case no key is entered which means the first for loop will
-                  go around len(self.top_array) times and each time it will call the values()
+                  go around len(self.top_keys) times and each time it will call the values()
                   function on from LinearProbeTable on the table.
                   This makes the best case complexity of the function
-                  O(len(self.top_array)) * O(LinearProbeTable.values()) or the second for
+                  O(len(self.top_keys)) * O(LinearProbeTable.values()) or the second for
                   loop will go around once and find the table and call the values() function on
                   it from the LinearProbeTable and will make the complexity O(LinearProbeTable.values())
                   this gives the function a over all best case complxity of
-                  O(len(self.top_array)) * O(LinearProbeTable.values()) + O(LinearProbeTable.values())
+                  O(len(self.top_keys)) * O(LinearProbeTable.values()) + O(LinearProbeTable.values())
         """
 
         values = []
 
         if key is None:
-            for space in range(len(self.top_array)):
-                if self.top_array[space] is not None:
-                    values += self.top_array[space][self.table_pos].values()
+            #read the internal arrays directly into a list of the known final size
+            values = [None] * self.length
+            count = 0
+            top_tables = self.top_tables
+            for space in range(len(top_tables)):
+                table = top_tables[space]
+                if table is not None:
+                    inner = table.array
+                    for in_space in range(len(inner)):
+                        item = inner[in_space]
+                        if item is not None:
+                            values[count] = item[1]
+                            count += 1
             return values
         elif key is not None:
-            for space in range(len(self.top_array)):
-                if self.top_array[space] is not None and self.top_array[space][self.key_pos] == key:
-                    values = self.top_array[space][self.table_pos].values()
+            top_keys = self.top_keys
+            for space in range(len(top_keys)):
+                if top_keys[space] == key:
+                    values = self.top_tables[space].values()
             return values
 
     def __contains__(self, key: tuple[K1, K2]) -> bool:
@@ -545,8 +440,8 @@ class DoubleKeyTable(Generic[K1, K2, V]):
                   O(best case self._linear_probe(key[0],key[1],False) + O(best case LinearProbeTable.__getitem__(key[1]))
         """
         key1, key2 = key
-        pos_key1, pos_key2 = self._linear_probe(key1, key2, False)
-        return self.top_array[pos_key1][self.table_pos][key2]
+        pos_key1, pos_key2 = self._linear_probe_h(key1, self.hash1(key1), key2, False)
+        return self.top_tables[pos_key1][key2]
 
     def __setitem__(self, key: tuple[K1, K2], data: V) -> None:
         """
@@ -560,40 +455,70 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         Returns:
             -None: Function does not return a value
         Complexity:
-            -Worst case: O(self._linear_probe(key[0],key[1], True)) + O(LinearProbeTable.is_empty)
-                         + O(LinearProbeTable.__contains__(key[1]) + O(LinearProbeTable.__setitem__(key[1]) = data)
-                         + O(self._rehash)
-                - in the worst case the function has to call self._linear_probe,
-                  LinearProbeTable.is_empty, LinearProbeTable.__contains__,
-                  LinearProbeTable.__setitem__ and self._rehash this makes the
-                  worst case complexity
-                  O(self._linear_probe(key[0],key[1], True)) + O(LinearProbeTable.is_empty)
-                  + O(LinearProbeTable.__contains__(key[1]) + O(LinearProbeTable.__setitem__(key[1]) = data)
-                  + O(self._rehash)
-            -Best case: O(best case self._linear_probe(key[0],key[1], True)) + O(best case LinearProbeTable.is_empty)
-                        + O(best case LinearProbeTable.__contains__(key[1])
-                        + O( best caseLinearProbeTable.__setitem__(key[1]) = data)
-                - in the best case the function has to call self._linear_probe,
-                  LinearProbeTable.is_empty, LinearProbeTable.__contains__ and
-                  LinearProbeTable.__setitem__ this makes the worst case complexity
-                  O(best case self._linear_probe(key[0],key[1], True)) + O(best case LinearProbeTable.is_empty)
-                  + O(best case LinearProbeTable.__contains__(key[1])
-                  + O( best caseLinearProbeTable.__setitem__(key[1]) = data)
+            -Worst case: O(self._linear_probe(key[0],key[1], True))
+                         + O(LinearProbeTable._rehash) + O(self._rehash)
+                - in the worst case the function has to call self._linear_probe and
+                  both the internal table and the top array have to be rehashed. The
+                  data is written straight into the slot the probe returned, so the
+                  internal table is only searched once.
+            -Best case: O(best case self._linear_probe(key[0],key[1], True))
+                - in the best case the function only has to call self._linear_probe
+                  and no rehash is needed.
         """
         key1, key2 = key
+        #intern string top level keys so later probes can match them by identity
+        if type(key1) is str:
+            key1 = sys.intern(key1)
         #get key positions
-        pos_key1, pos_key2 = self._linear_probe(key1, key2, True)
-        #check is top key already has a bottom key and value
-        if self.top_array[pos_key1][self.table_pos].is_empty():
+        pos_key1, pos_key2 = self._linear_probe_h(key1, self.hash1(key1), key2, True)
+        #insert data at the probed slot, counting it if key2 was not there yet
+        if not self.top_tables[pos_key1]._set_at(pos_key2, key2, data):
             self.length += 1
-            self.top_length += 1
-        elif not(key2 in self.top_array[pos_key1][self.table_pos]):
-            self.length += 1
-        #insert data into table
-        self.top_array[pos_key1][self.table_pos][key2] = data
         #check if rehash is needed
         if self.top_length > self.table_size / 2:
             self._rehash()
+        #too many tombstones make probes long, clear them without growing. checked on its
+        #own since _rehash does nothing once the size list has run out
+        if self.tombstone_count > 0 and self.top_length + self.tombstone_count > 0.7 * self.table_size:
+            self._reinsert_top(self.table_size)
+
+    def update(self, pairs: Iterable[tuple[tuple[K1, K2], V]]) -> None:
+        """
+        update function sets every key pair in pairs to its value. The top array is
+        grown to fit all the top level keys before anything is inserted, so a bulk
+        load does not trigger a rehash part way through.
+        Args:
+            -pairs: iterable of ((key1, key2), data) items
+        Raises:
+            -FullError: if a table is full FullError is raised
+        Returns:
+            -None: Function does not return a value
+        Complexity:
+            -Worst case: O(len(self.top_keys) + S + N * self.__setitem__ + self._reinsert_top)
+                - the existing top level keys are collected, the first of the S remaining
+                  sizes that fits them is found, the top array is moved into it once and
+                  every pair is inserted once. N is the number of pairs.
+            -Best case: O(len(self.top_keys) + N * self.__setitem__)
+                - the top array is already big enough so no rehash happens.
+        """
+        pairs = list(pairs)
+        try:
+            top_needed = len(set(self.keys()).union(key1 for (key1, key2), data in pairs))
+        except TypeError:
+            #top level keys Python cannot hash, with hash1 overridden. leave the
+            #top array to grow as the pairs are inserted
+            top_needed = 0
+        #pick the first size that fits every top level key, or the largest there is,
+        #and move the top array into it once while the table is still small.
+        #_rehash moves the index past the end once the sizes run out
+        index = min(self.top_table_sizes_index, len(self.top_table_sizes) - 1)
+        while top_needed > self.top_table_sizes[index] / 2 and index + 1 < len(self.top_table_sizes):
+            index += 1
+        if index > self.top_table_sizes_index:
+            self.top_table_sizes_index = index
+            self._reinsert_top(self.top_table_sizes[index])
+        for (key1, key2), data in pairs:
+            self[key1, key2] = data
 
     def __delitem__(self, key: tuple[K1, K2]) -> None:
         """
@@ -606,13 +531,13 @@ class DoubleKeyTable(Generic[K1, K2, V]):
             -None: Function does not return a value
         Complexity:
             -Worst case: O(LinearProbeTable.__delitem__(key[1])) + O(self._linear_probe(key[0],key[1],False))
-                         + O(LinearProbeTable.is_empty()) + O(len(self.top_array) * self.__setitem__)
+                         + O(LinearProbeTable.is_empty())
                 - in the worst case the function has to call the LinearProbeTable.__delitem__(key[1])
-                  function, the self._linear_probe(key[0],key[1],False) function, LinearProbeTable.is_empty
-                  function and has to reinsert all other values in the table using the self.__setitem__ function.
+                  function, the self._linear_probe(key[0],key[1],False) function and the LinearProbeTable.is_empty
+                  function. An emptied top level slot is marked with a tombstone so nothing has to be reinserted.
                   This makes the worst case complexity of the function
                   O(LinearProbeTable.__delitem__(key[1])) + O(self._linear_probe(key[0],key[1],False))
-                  + O(LinearProbeTable.is_empty()) + O(len(self.top_array) * self.__setitem__)
+                  + O(LinearProbeTable.is_empty())
             -Best case: O(best case LinearProbeTable.__delitem__(key[1])) + O(best case self._linear_probe(key[0],key[1],False))
                         + O(best case LinearProbeTable.is_empty())
                 - in the best case the function has to call the LinearProbeTable.__delitem__(key[1])
@@ -625,22 +550,20 @@ class DoubleKeyTable(Generic[K1, K2, V]):
 
         key1, key2 = key
         #get positions
-        top_position, in_position = self._linear_probe(key1, key2, False)
+        top_position, in_position = self._linear_probe_h(key1, self.hash1(key1), key2, False)
         #delete item
-        del self.top_array[top_position][self.table_pos][key2]
+        top_keys = self.top_keys
+        top_tables = self.top_tables
+        sub_table = top_tables[top_position]
+        del sub_table[key2]
         self.length -= 1
         #check if top key can be deleted
-        if self.top_array[top_position][self.table_pos].is_empty():
-            self.top_array[top_position] = None
+        if sub_table.is_empty():
+            #leave a tombstone so keys further along the cluster can still be found
+            top_keys[top_position] = TOMBSTONE
+            top_tables[top_position] = None
             self.top_length -= 1
-            top_position = (top_position + 1) % self.table_size
-            #reinsert items up until empty spot
-            while self.top_array[top_position] is not None:
-                key1, internal_table = self.top_array[top_position]
-                self.top_array[top_position] = None
-                new_pos_key1, new_pos_key2 = self._linear_probe(key1, " ", True)
-                self.top_array[new_pos_key1] = (key1, internal_table)
-                top_position = (top_position + 1) % self.table_size
+            self.tombstone_count += 1
 
 
     def _rehash(self) -> None:
@@ -659,13 +582,13 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         Returns:
             -None: Function does not return a value
         Complexity:
-            -Worst case: O(N * self.__setitem__ * self.values() * len(self.values()) + O(top_table_sizes[top_table_size_index + 1]
-                - in the worst case the function has to call the self.__setitem__ function
-                  on every value in the table and has to get all the values using the values
-                  function and go through them and it has to create a new array. This gives
-                  the function a worst case complexity of
-                  O(N * self.__setitem__ * self.values() * len(self.values()) + O(top_table_sizes[top_table_size_index + 1]
-                  where N is the length of the initial top array.
+            -Worst case: O(N * hash1 + N^2) + O(top_table_sizes[top_table_size_index + 1])
+                - in the worst case the function has to create a new array and hash every
+                  top level key again, probing past every key already moved. The internal
+                  tables are moved as they are so none of the values have to be reinserted.
+                  This gives the function a worst case complexity of
+                  O(N * hash1 + N^2) + O(top_table_sizes[top_table_size_index + 1])
+                  where N is the number of top level keys.
             -Best case: O(1)
                 - in the best case there are no more table sizes in self.top_table_sizes
                   and the function will go into the first if statement and return None
@@ -678,20 +601,51 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         if self.top_table_sizes_index >= len(self.top_table_sizes):
             return None
         else:
-            #create new top array
-            current_array = self.top_array
-            self.top_array = ArrayR(self.top_table_sizes[self.top_table_sizes_index])
-            #reinsert all values into new array
-            for space in range(len(current_array)):
-                if current_array[space] is not None:
-                    key1, table = current_array[space]
-                    self.top_length -= 1
-                    vals = table.values()
-                    vals_index = 0
-                    for key2 in table.keys():
-                        self[(key1, key2)] = vals[vals_index]
-                        vals_index += 1
-                        self.length -= 1
+            self._reinsert_top(self.top_table_sizes[self.top_table_sizes_index])
+
+    def _reinsert_top(self, size: int) -> None:
+        """
+        _reinsert_top creates new top arrays of the given size and moves every
+        internal table into them as it is, which also drops all tombstones.
+        Args:
+            -size: size of the new top arrays
+        Raises:
+            -None: Function raises no errors
+        Returns:
+            -None: Function does not return a value
+        Complexity:
+            -Worst case: O(size + N * hash1 + N^2)
+                - the new arrays have to be created and every top level key hashed again,
+                  and in the worst case every key probes past all the keys moved before it.
+                  This gives the function a worst case complexity of O(size + N * hash1 + N^2)
+                  where N is the number of top level keys.
+            -Best case: O(size + N * hash1)
+                - in the best case every key goes into the slot it hashes to so no probing
+                  is needed, giving a best case complexity of O(size + N * hash1) where N is
+                  the number of top level keys.
+        """
+        #create new top array
+        current_keys = self.top_keys
+        current_tables = self.top_tables
+        self.top_keys = [None] * size
+        self.top_tables = [None] * size
+        self.tombstone_count = 0
+        top_keys = self.top_keys
+        top_tables = self.top_tables
+        #move every internal table into the new array, deleted slots have no table.
+        #keys are distinct and the new array has no tombstones, so the first empty
+        #slot is the right one and length/top_length stay the same
+        for space in range(len(current_keys)):
+            table = current_tables[space]
+            if table is not None:
+                key1 = current_keys[space]
+                top_position = self.hash1(key1)
+                while top_keys[top_position] is not None:
+                    top_position += 1
+                    if top_position == size:
+                        top_position = 0
+                top_keys[top_position] = key1
+                top_tables[top_position] = table
 
     @property
     def table_size(self) -> int:
@@ -709,7 +663,7 @@ class DoubleKeyTable(Generic[K1, K2, V]):
             -Best case: O(1)
                 - worst case is constant which is the best possible case so best case is constant.
         """
-        return len(self.top_array)
+        return len(self.top_keys)
 
     def __len__(self) -> int:
         """
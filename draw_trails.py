@@ -28,20 +28,20 @@ class Box:
 # These inheritance models are just for hinting that we are injection
 # the box attributes into the existing trail classes.
 
-@dataclass
+@dataclass(eq=False)
 class TrailSplitBox(TrailSplit):
 
     branch_start_box: Box = field(default_factory=Box)
     branch_end_box: Box = field(default_factory=Box)
 
-@dataclass
+@dataclass(eq=False)
 class TrailSeriesBox(TrailSeries):
 
     before_box: Box = field(default_factory=Box)
     mountain_box: Box = field(default_factory=Box)
     after_box: Box = field(default_factory=Box)
 
-@dataclass
+@dataclass(eq=False)
 class TrailBox(Trail):
 
     trail_box: Box = field(default_factory=Box)
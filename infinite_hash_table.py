@@ -1,14 +1,15 @@
 from __future__ import annotations
 from typing import Generic, TypeVar
 
-from data_structures.referential_array import ArrayR
-
 
 
 K = TypeVar("K")
 V = TypeVar("V")
 
 class Nodes(Generic[K, V]):
+    #leaves are the most common object in the table, slots drop the per leaf __dict__
+    __slots__ = ('key', 'value')
+
     def __init__(self, key:str, value:int) -> None:
         self.key = key
         self.value = value
@@ -28,8 +29,11 @@ class InfiniteHashTable(Generic[K, V]):
     TABLE_SIZE = 27
 
     def __init__(self, level:int = 0) -> None:
-        self.table = ArrayR(self.TABLE_SIZE)
+        #only the occupied positions are stored, most tables hold a handful of items
+        self.table: dict[int, Nodes[K, V]|InfiniteHashTable[K, V]] = {}
         self.level = level
+        #number of items stored in this table and all tables below it
+        self._count = 0
 
     def hash(self, key: K) -> int:
         if self.level < len(key):
@@ -53,32 +57,59 @@ class InfiniteHashTable(Generic[K, V]):
               having to iterate through any other elements in the bucket.
         """
         
-        if self.table[self.hash(key)] == None:
-            raise KeyError()
-        else:
-            element = self.table[self.hash(key)]
-            if isinstance(element, InfiniteHashTable):
-                return element.__getitem__(key)
-            else:
+        #walk down the nested tables instead of recursing
+        table = self
+        while True:
+            element = table.table.get(table.hash(key))
+            if element is None:
+                raise KeyError(key)
+            if type(element) is not InfiniteHashTable:
+                if element.key != key:
+                    raise KeyError(key)
                 return element.value
+            table = element
 
     def __setitem__(self, key: K, value: V) -> None:
         """
         Set an (key, value) pair in our hash table.
+
+        :raises ValueError: when the key and a stored key land on the same position at every
+                            level, so the two can never be told apart.
         """
-        element = Nodes(key,value)
-        if self.table[self.hash(key)]==None:
-            self.table[self.hash(key)] = element
-        else:
-            table = self.table[self.hash(key)]
-            if isinstance(table, InfiniteHashTable):
-                table.__setitem__(key, value)
+        #tables passed through, their counts go up if the key is new
+        path = []
+        #first leaf moved down, put back if the key turns out not to fit
+        moved = None
+        table = self
+        while True:
+            path.append(table)
+            position = table.hash(key)
+            element = table.table.get(position)
+            if element is None:
+                table.table[position] = Nodes(key, value)
+                break
+            if type(element) is InfiniteHashTable:
+                table = element
+            elif element.key == key:
+                element.value = value
+                return
             else:
-                oldValue = table
-                newtable = InfiniteHashTable(self.level + 1)
-                newtable.__setitem__(oldValue.key, oldValue.value)
-                newtable.__setitem__(key, value)
-                self.table[self.hash(key)] = newtable
+                #both keys have run out, they share the last position on every level below
+                if table.level >= len(key) and table.level >= len(element.key):
+                    if moved is not None:
+                        parent, parent_position, leaf = moved
+                        parent.table[parent_position] = leaf
+                    raise ValueError(f"{key!r} and {element.key!r} share every position")
+                if moved is None:
+                    moved = (table, position, element)
+                #move the existing leaf one level down and keep going from there
+                newtable = InfiniteHashTable(table.level + 1)
+                newtable.table[newtable.hash(element.key)] = element
+                newtable._count = 1
+                table.table[position] = newtable
+                table = newtable
+        for table in path:
+            table._count += 1
 
 
     def __delitem__(self, key: K) -> None:
@@ -99,38 +130,49 @@ class InfiniteHashTable(Generic[K, V]):
         
         """
         
-        if self.table[self.hash(key)] == None:
-            raise KeyError()
-        else:
-            element = self.table[self.hash(key)]
-            if isinstance(element, InfiniteHashTable):
-                self.table[self.hash(key)].__delitem__(key)
-                if len(self.table[self.hash(key)]) == 0:
-                    self.table[self.hash(key)] = None
-                elif len(self.table[self.hash(key)]) == 1:
-                    object = self.table[self.hash(key)].lookforlastobject()
-                    self.table[self.hash(key)] = object
+        #walk down to the leaf, remembering the tables passed through
+        path = []
+        table = self
+        while True:
+            position = table.hash(key)
+            element = table.table.get(position)
+            if element is None:
+                raise KeyError(key)
+            if type(element) is not InfiniteHashTable:
+                break
+            path.append((table, position))
+            table = element
+        if element.key != key:
+            raise KeyError(key)
+        del table.table[position]
+        table._count -= 1
+        for parent, position in path:
+            parent._count -= 1
+        #walk back up, removing empty tables and pulling up tables with a single item.
+        #a table never holds fewer items than one below it, so once a subtable keeps
+        #two or more items nothing above it changes either
+        for parent, position in reversed(path):
+            subtable = parent.table[position]
+            size = subtable._count
+            if size == 0:
+                del parent.table[position]
+            elif size == 1:
+                parent.table[position] = subtable.lookforlastobject()
             else:
-                self.table[self.hash(key)] = None
+                break
 
     def lookforlastobject(self):
-        object = None
-        for item in self.table:
-            if item != None:
-                object = item
-        return object
+        #only called when a single item is left
+        return next(iter(self.table.values()), None)
     
 
     def __len__(self):
+        """
+        Number of items in this table and all tables below it.
 
-        count = 0
-        for i in range(self.TABLE_SIZE):
-            if self.table[i] is not None:
-                if isinstance(self.table[i], InfiniteHashTable):
-                    count+=len(self.table[i])
-                else:
-                    count += 1
-        return count
+        :complexity: O(1), the count is kept up to date by set and delete.
+        """
+        return self._count
 
 
   
@@ -142,12 +184,11 @@ class InfiniteHashTable(Generic[K, V]):
         Not required but may be a good testing tool.
         """
         items = []
-        for i in range(self.TABLE_SIZE):
-            if self.table[i] is not None:
-                if isinstance(self.table[i], InfiniteHashTable):
-                    items.append(f"[{i}]: {str(self.table[i])}")
-                else:
-                    items.append(f"[{i}]: {self.table[i].value}")
+        for i in sorted(self.table):
+            if type(self.table[i]) is InfiniteHashTable:
+                items.append(f"[{i}]: {str(self.table[i])}")
+            else:
+                items.append(f"[{i}]: {self.table[i].value}")
         return "{" + ", ".join(items) + "}"
 
     def get_location(self, key):
@@ -167,12 +208,14 @@ class InfiniteHashTable(Generic[K, V]):
               hash table, and we can access it directly without having to traverse any
               nested InfiniteHashTables or iterate through any other elements in the same bucket.
         """
-        positions = [self.hash(key)]
-        table = self.table[self.hash(key)]
-        while isinstance(table, InfiniteHashTable):
-            positions.append(table.hash(key))
-            table = table.table[table.hash(key)]
-        if table == None:
+        position = self.hash(key)
+        positions = [position]
+        table = self.table.get(position)
+        while type(table) is InfiniteHashTable:
+            position = table.hash(key)
+            positions.append(position)
+            table = table.table.get(position)
+        if table is None:
             raise KeyError
         elif table.key != key:
             raise KeyError
@@ -184,14 +227,16 @@ class InfiniteHashTable(Generic[K, V]):
         """
         Checks to see if the given key is in the Hash Table
 
-        :complexity: See linear probe.
+        :complexity: Same as __getitem__, without raising on a miss.
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        table = self
+        while True:
+            element = table.table.get(table.hash(key))
+            if element is None:
+                return False
+            if type(element) is not InfiniteHashTable:
+                return element.key == key
+            table = element
 
 
 
@@ -282,7 +282,7 @@ class MyWindow(arcade.Window):
             t = deserialize(json.loads(f.read()))
         try:
             # Try to add all existing mountains
-            for mountain in t.collect_all_mountains():
+            for mountain in t.iter_mountains():
                 self.mountain_manager.add_mountain(mountain)
         except NotImplementedError:
             pass
@@ -3,49 +3,148 @@ from mountain import Mountain
 class MountainManager:
     def __init__(self):
         self.mountains = []
+        #position of each mountain in self.mountains, keyed by id(mountain)
+        self._pos: dict[int, int] = {}
+        #mountains grouped by difficulty level, kept in step with self.mountains
+        self._by_diff: dict[int, list[Mountain]] = {}
+        #difficulty level each mountain was grouped under, keyed by id(mountain).
+        #mountains can be edited in place, so their current level may differ
+        self._diff_of: dict[int, int] = {}
+        #sorted difficulty levels, None when a group has been added or removed since last sorted
+        self._sorted_diffs: list[int]|None = []
 
     def add_mountain(self, mountain: Mountain):
         """
+        :raises ValueError: if this mountain object is already in the collection.
+
         Complexity:
-            - Worst case: O(N) where N is the number of mountains in the list.
-                - In the worst case, the given mountain object is the last one in the list
-                  or is not in the list at all. In either case, we need to iterate through
-                  the entire list to determine this, which takes O(N) time.
+            - Worst case: O(1)
+                - The mountain is appended to the list and to the group for its
+                  difficulty level, both of which take constant time.
             - Best case: O(1)
-                - In the best case, the given mountain object is the first one in the list.
-                  Therefore, we can remove it in constant time, or O(1).
+                - Same as the worst case.
         """
+        #positions are keyed by id, so each mountain object can only be stored once
+        if id(mountain) in self._pos:
+            raise ValueError(f"{mountain} is already in the collection")
+        self._pos[id(mountain)] = len(self.mountains)
         self.mountains.append(mountain)
+        self._add_to_group(mountain)
 
     def remove_mountain(self, mountain: Mountain):
         """
+    :raises ValueError: if the mountain is not in the collection.
+
     Complexity:
     - Worst case: O(n) where n is the number of mountains in the list.
-        - In the worst case, the mountain to be removed is at the end of the list,
-          or is not in the list at all. In this case, we have to iterate through
-          all the mountains in the list to determine whether the mountain to be
-          removed is in the list or not, and then remove it if it is.
+        - In the worst case, the given object is not stored but an equal mountain is,
+          so the list has to be searched for it like list.remove would.
     - Best case: O(1)
-        - In the best case, the mountain to be removed is at the beginning of the list.
-          Therefore, we can remove it directly without having to iterate through any other
-          mountains in the list.
+        - In the best case, the stored mountain is given, its position is looked up
+          directly and the last mountain in the list is moved into its place, so nothing
+          has to be shifted. It is the first one in its difficulty group.
         """
-        self.mountains.remove(mountain)
+        index = self._index_of(mountain)
+        if index is None:
+            raise ValueError(f"{mountain} is not in the collection")
+        #nothing below can raise, so the list, positions and groups stay in step
+        mountain = self.mountains[index]
+        del self._pos[id(mountain)]
+        self._remove_from_group(mountain)
+        #move the last mountain into the gap instead of shifting the rest of the list
+        last = self.mountains.pop()
+        if index < len(self.mountains):
+            self.mountains[index] = last
+            self._pos[id(last)] = index
 
     def edit_mountain(self, old_mountain: Mountain, new_mountain: Mountain):
         """
+        The old mountain can be the stored mountain, a mountain equal to it, or a copy taken
+        before the stored mountain was edited in place and passed in as new_mountain.
+
+        :raises ValueError: if the old mountain is not in the collection, or new_mountain is
+                            already stored somewhere else.
+
         Complexity:
         - Worst case: O(N) where N is the number of mountains in the list.
-            - In the worst case, the old mountain is located at the end of the list,
-              which requires iterating through all previous mountains to reach it.
-              Additionally, after replacing the mountain, we have to shift all the
-              remaining elements to the left by one position, which takes O(N) time.
+            - Neither mountain is stored, so the list is searched for a mountain equal
+              to the old one.
         - Best case: O(1)
-            - In the best case, the old mountain is located at the beginning of the list,
-              and we can replace it in constant time without any additional shifting.
+            - In the best case, one of the mountains is stored, its position is looked up
+              directly and it is the first one in its difficulty group.
+        """
+        index = self._pos.get(id(old_mountain))
+        if index is None:
+            #the editor passes a copy of the old values and the edited stored mountain
+            index = self._pos.get(id(new_mountain))
+        if index is None:
+            index = self._index_of(old_mountain)
+        if index is None:
+            raise ValueError(f"{old_mountain} is not in the collection")
+        if self._pos.get(id(new_mountain), index) != index:
+            raise ValueError(f"{new_mountain} is already in the collection")
+        self._replace_at(index, new_mountain)
+
+    def _index_of(self, mountain: Mountain) -> int|None:
         """
-        index = self.mountains.index(old_mountain)
+        Returns the position of the mountain in the list, looking it up by identity and
+        falling back to the first equal mountain, or None if there is no such mountain.
+
+        Complexity: O(1) if the mountain object is stored, O(N) otherwise.
+        """
+        index = self._pos.get(id(mountain))
+        if index is None:
+            for i in range(len(self.mountains)):
+                if self.mountains[i] == mountain:
+                    return i
+        return index
+
+    def _replace_at(self, index: int, new_mountain: Mountain):
+        """
+        Replaces the mountain at index with new_mountain and regroups it by its current
+        difficulty level. new_mountain may be the stored mountain itself after an in place edit.
+
+        Complexity: O(K) where K is the number of mountains in the old mountain's group.
+        """
+        stored = self.mountains[index]
+        del self._pos[id(stored)]
+        self._remove_from_group(stored)
         self.mountains[index] = new_mountain
+        self._pos[id(new_mountain)] = index
+        self._add_to_group(new_mountain)
+
+    def _add_to_group(self, mountain: Mountain):
+        """
+        Adds a mountain to the group for its difficulty level, creating the group if needed.
+
+        Complexity: O(1)
+        """
+        diff = mountain.difficulty_level
+        group = self._by_diff.get(diff)
+        if group is None:
+            group = self._by_diff[diff] = []
+            self._sorted_diffs = None
+        group.append(mountain)
+        self._diff_of[id(mountain)] = diff
+
+    def _remove_from_group(self, mountain: Mountain):
+        """
+        Removes a mountain from the group it was added to, dropping the group once it is empty.
+        The group is the one recorded when the mountain was added, not its current difficulty
+        level, since the mountain may have been edited in place since then.
+
+        Complexity: O(K) where K is the number of mountains in the group.
+        """
+        diff = self._diff_of.pop(id(mountain))
+        group = self._by_diff[diff]
+        #match by identity, an edited mountain may no longer equal anything
+        for i in range(len(group)):
+            if group[i] is mountain:
+                del group[i]
+                break
+        if not group:
+            del self._by_diff[diff]
+            self._sorted_diffs = None
 
     def mountains_with_difficulty(self, diff: int):
         """
@@ -55,43 +154,30 @@ class MountainManager:
         :return: A list of Mountain objects with the specified difficulty level.
 
         Complexity:
-        - Worst case: O(N) where N is the number of mountains in the collection.
-            - In the worst case, we have to iterate through all the mountains in the collection
-              to find the ones with the specified difficulty level.
+        - Worst case: O(K) where K is the number of mountains with the specified difficulty level.
+            - The group for the difficulty level is looked up directly and copied, so the
+              other mountains in the collection are never visited.
         - Best case: O(1)
-            - In the best case, the first mountain in the collection has the specified difficulty level,
-              so we can immediately return a list containing only that mountain without iterating
-              through any other mountains in the collection.
+            - In the best case, there are no mountains with the specified difficulty level,
+              so an empty list is returned immediately.
         """
-        result = []
-        for mountain in self.mountains:
-            if mountain.difficulty_level == diff:
-                result.append(mountain)
-        return result
+        return self._by_diff.get(diff, []).copy()
 
     def group_by_difficulty(self):
         """
         Groups mountains in the list by their difficulty level.
 
         Complexity:
-        - Worst case: O(N^2) where N is the number of mountains in the list.
-            - In the worst case, the mountains in the list are sorted in reverse order by
-              difficulty level, and we have to iterate through all previously created groups
-              to find the correct group to add each mountain to. This results in O(N^2) time complexity.
-        - Best case: O(NlogN)
-            - In the best case, the mountains in the list are already sorted by difficulty level.
-              Then, we only need to iterate through the list once, and each mountain is added to
-              the correct group immediately, resulting in a time complexity of O(NlogN).
+        - Worst case: O(N + GlogG) where N is the number of mountains in the list and G is
+          the number of difficulty levels.
+            - The mountains are already grouped, so only the difficulty levels need to be
+              sorted and every group copied into the result.
+        - Best case: O(N)
+            - No difficulty level has been added or removed since the last call, so the
+              sorted difficulty levels are reused and only the groups are copied.
          """
-        sorted_mountains = sorted(self.mountains, key=lambda m: m.difficulty_level)
-        result = []
-        for mountain in sorted_mountains:
-            for group in result:
-                if group[0].difficulty_level == mountain.difficulty_level:
-                    group.append(mountain)
-                    break
-            else:
-                result.append([mountain])
-        return result
-
+        if self._sorted_diffs is None:
+            self._sorted_diffs = sorted(self._by_diff)
+        by_diff = self._by_diff
+        return [by_diff[diff].copy() for diff in self._sorted_diffs]
 
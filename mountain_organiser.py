@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from mountain import Mountain
-from algorithms.mergesort import *
-from algorithms.binary_search import binary_search, _binary_search_aux
+from bisect import bisect_left
 
 
 class MountainOrganiser:
@@ -49,17 +48,18 @@ class MountainOrganiser:
             -res: rank of the mountain within the mountain organiser in terms
                   of length.
         Complexity:
-            -Worst case: O(logN)
+            -Worst case: O(logN + K)
                 - all operations are constant except for the search function so worst case
-                  complexity is worst case complexity of search function which is O(logN)
-                  where N is the length of the list of mountains in the mountain organiser.
+                  complexity is worst case complexity of search function which is O(logN + K)
+                  where N is the length of the list of mountains in the mountain organiser and
+                  K is the number of mountains with the same length as the given mountain.
             -Best case: O(logN)
                 - all operations are constant except for the search function so best case
                   complexity is best case complexity of search function which is O(logN)
                   where N is the length of the list of mountains in the mountain organiser.
         """
         #get rank of mountain
-        rank = self.search(self.lengths, mountain.length, 0, len(self.lengths), mountain)
+        rank = self.search(mountain)
         #if rank is None mountain is not with in mountain organiser, rasise keyError
         if rank is None: raise KeyError
         #return the moutains rank
@@ -68,47 +68,40 @@ class MountainOrganiser:
 
 
 
-    def search(self, list:list[int], val:int, min:int, max:int, mountain:Mountain):
+    def search(self, mountain: Mountain) -> int|None:
         """
-        search function takes in a list of lengths, a min search value, a max search value
-        and a mountain and searches for the mountains length in the list of lengths within
-        the min and max values index of the list of lengths.
+        search function takes in a mountain and finds its position in the list of mountains.
+        The first mountain with the same length is found with a binary search and the
+        mountains with that length are then checked in order.
         Args:
-            -list: A list of the lengths of the mountains within the mountain organiser
-            -val: The length of the mountain being searched for.
-            -min: min index value to search in the list.
-            -max: max index value to search in the list.
             -mountain: the mountain being looked for.
         Raises:
             -None: Function raises no errors
         Returns:
-            -pos: The function returns the position of the mountain in list of lengths.
+            -pos: The function returns the position of the mountain in list of lengths, or
+                  None if the mountain is not in the mountain organiser.
         Complexity:
-            -Worst case: O(logN)
-                - The worst case for the _binary_search_aux function in this case is O(logN)
-                  where N is the length of the list of lengths being passed into the search
-                  function. The worst case complexity of the rest of the function is O(logN)
-                  since the function calls itself of on the same list which has been split
-                  in half. This gives the function a worst case complexity of O(logN) + O(logN)
-                  which can be simplified to O(logN) where N is the length of the list of lengths
-                  being passed in.
+            -Worst case: O(logN + K)
+                - bisect_left has a complexity of O(logN) where N is the length of the list of
+                  lengths. In the worst case the mountain is the last of the K mountains with the
+                  same length, or is not there, so all K of them have to be checked. This gives the
+                  function a worst case complexity of O(logN + K).
             -Best case: O(logN)
-                - best case = worst case since function performs same operations each time.
-                  O(logN) where N is the length of the list of lengths being passed in.
+                - in the best case the mountain is the first mountain with its length so only the
+                  binary search is needed, giving a best case complexity of O(logN) where N is the
+                  length of the list of lengths.
         """
-        #search for position
-        pos = _binary_search_aux(list, val, min, max)
-        #return position if position is found
-        if self.mountains[pos][2] == mountain.name and self.mountains[pos][1] == mountain.difficulty_level:
-            return pos
-        #search again if position is not found
-        else:
-            if min <= pos - 1 and max >= pos + 1:
-                return self.search(list, val, min, pos - 1, mountain) or self.search(list, val, pos + 1, max, mountain)
-            if min <= pos - 1 and list[pos - 1] == val:
-                return self.search(list, val, min, pos - 1, mountain)
-            if max >= pos + 1 and list[pos + 1] == val:
-                return self.search(list, val, pos + 1, max, mountain)
+        lengths = self.lengths
+        mountains = self.mountains
+        val = mountain.length
+        #find first mountain with the same length
+        pos = bisect_left(lengths, val)
+        #check mountains with the same length until the mountain is found
+        while pos < len(lengths) and lengths[pos] == val:
+            if mountains[pos][2] == mountain.name and mountains[pos][1] == mountain.difficulty_level:
+                return pos
+            pos += 1
+        return None
 
 
     def add_mountains(self, mountains: list[Mountain]) -> None:
@@ -122,56 +115,33 @@ class MountainOrganiser:
         Returns:
             -None: Function does not return a value
         Complexity:
-            -Worst case: O(Mlog(M) + N)
-                - all operations are constant except for the copy function, the for loop, the
-                  mergesort function and the merge function. The copy function has a worst case
-                  complexity of O(M) for lists where M is the length of the list as per the
-                  python documentation for lists in this case M is the length of the mountains list
-                  being passed in, the for loop has a worst case complexity of O(M) where M is the
-                  length of the mountains list being passed in, the mergesort function has a worst
-                  case complexity of O(MlogM * comp(T)) which in this case is O(MlogM) where M is
-                  the length of the mountains list being passed in since the comparison is a
-                  comparison of integers which is has a constant time complexity and the merge function
-                  has a worst case complexity of O(n comp(T)) which in this case is O(M + N) where M is
-                  the length of the mountains list being passed in and N is the length of the existing
-                  list of mountains and the complexity of the comparison is ignored since it is a
-                  comparison between integers which has a worst case complexity of O(1). In the worst
-                  case the function will complete the copy function, the for loop, the mergesort function
-                  and the merge function which gives the function a worst case complexity of
-                  O(M) + O(M) + O(MlogM) + O(M) + O(N) which can be simplified to O(MlogM + N) where M
-                  is the length of the mountains list being passed in and N is the length of the list
-                  of existing mountains.
-
-            -Best case: O(MlogM)
-                - The best case complexity for the copy function of a list is O(n) where n is the
-                  length of the list as per the python documentation which is this case is O(M) where M is the
-                  length of the mountains list being passed in, the best case complexity of the for loop is
-                  O(M) where M is the length of the mountains list being passed in and the best case complexity
-                  of the mergesort function is O(NlogN * comp(T)) which in this case is O(MlogM) where M is the
-                  length of the list being passed in since the comparison is a comparison of integers which is
-                  constant. In the best case the function completes the copy function, the for loop and the mergesort
-                  function which gives the function a best case complexity of O(M) + O(M) + O(MlogM) which can be
-                  simplified to O(MlogM) where M is the length of the list of mountains being passed in.
+            -Worst case: O((M + N)log(M + N))
+                - building the list of tuples for the new mountains takes O(M) where M is the
+                  length of the mountains list being passed in. The existing list and the new
+                  tuples are then sorted together with the built in sorted function (Timsort),
+                  which has a worst case complexity of O(KlogK * comp(T)) where K = M + N and N is
+                  the length of the existing list of mountains. Building the list of lengths from
+                  the sorted list takes O(M + N). This gives the function a worst case complexity
+                  of O(M) + O((M + N)log(M + N)) + O(M + N) which can be simplified to
+                  O((M + N)log(M + N)).
+
+            -Best case: O(M + N)
+                - Timsort finds sorted runs in its input, so when the new mountains are already
+                  in order it only has to merge the two runs, which takes O(M + N). Together with
+                  building the tuples and the lengths this gives the function a best case complexity
+                  of O(M + N) where M is the length of the mountains list being passed in and N is the
+                  length of the list of existing mountains.
         """
 
-        mountains = mountains
-        lengths = mountains.copy()
         #create list of mountains with tuple values of (length, difficulty_level, name)
-        #and create list of mountain lengths
-        for mountain in range(len(mountains)):
-            mountains[mountain] = (mountains[mountain].length, mountains[mountain].difficulty_level, mountains[mountain].name)
-            lengths[mountain] = lengths[mountain].length
-
-        #sort list of mountains in terms of lengths
-        mountains = mergesort(mountains)
-        #sort list of mountain lengths
-        lengths = mergesort(lengths)
+        #without changing the list that was passed in
+        new_mountains = [(mountain.length, mountain.difficulty_level, mountain.name) for mountain in mountains]
 
-        #set mountains and lengths if there are none
+        #sort new mountains together with existing mountains, Timsort merges the
+        #already sorted existing list as a single run
         if self.mountains is None:
-            self.mountains = mountains
-            self.lengths = lengths
-        #merge mountains and lengths with existing mountains and lengths
+            self.mountains = sorted(new_mountains)
         else:
-            self.mountains = merge(self.mountains, mountains)
-            self.lengths = merge(self.lengths, lengths)
+            self.mountains = sorted(self.mountains + new_mountains)
+        #list of mountain lengths in the same order as the mountains
+        self.lengths = [mountain[0] for mountain in self.mountains]
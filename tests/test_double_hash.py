@@ -123,3 +123,90 @@ class TestDoubleHash(unittest.TestCase):
         # with an iterator.
         self.assertRaises(BaseException, lambda: next(key_iterator))
         self.assertRaises(BaseException, lambda: next(value_iterator))
+
+    @number("3.6")
+    def test_update(self):
+        dt = DoubleKeyTable(sizes=[3, 5, 13], internal_sizes=[5, 13])
+        dt["Tim", "Jen"] = 1
+
+        dt.update([(("Amy", "Ben"), 2), (("May", "Ben"), 3), (("Tim", "Bob"), 4), (("Tim", "Jen"), 5)])
+        # Resized once up front, straight from 3 to 13, for the 3 top level keys.
+        self.assertEqual(dt.table_size, 13)
+        self.assertEqual(len(dt), 4)
+        self.assertEqual(set(dt.keys()), {"Tim", "Amy", "May"})
+        self.assertEqual(dt["Tim", "Jen"], 5)
+        self.assertEqual(dt["Tim", "Bob"], 4)
+        self.assertEqual(dt["May", "Ben"], 3)
+
+        # Sizes have run out, update should keep the largest one.
+        dt = DoubleKeyTable(sizes=[3], internal_sizes=[5])
+        dt["Tim", "Jen"] = 1
+        dt["Amy", "Jen"] = 2
+        dt.update([(("May", "Ben"), 3)])
+        self.assertEqual(dt.table_size, 3)
+        self.assertEqual(len(dt), 3)
+        self.assertEqual(dt["May", "Ben"], 3)
+
+    @number("3.7")
+    def test_unhashable_keys(self):
+        # Top level keys Python cannot hash only need hash1 overridden.
+        dt = DoubleKeyTable(sizes=[12], internal_sizes=[5])
+        dt.hash1 = lambda k: sum(k) % 12
+
+        dt[[1, 2], "Jen"] = 1
+        dt[[3], "Ben"] = 2
+        dt.update([(([4, 5], "Tom"), 3), (([1, 2], "Bob"), 4)])
+        self.assertEqual(dt[[1, 2], "Jen"], 1)
+        self.assertEqual(dt[[3], "Ben"], 2)
+        self.assertEqual(dt[[1, 2], "Bob"], 4)
+        self.assertEqual(len(dt), 4)
+
+        del dt[[3], "Ben"]
+        self.assertRaises(KeyError, lambda: dt[[3], "Ben"])
+        self.assertEqual(dt[[4, 5], "Tom"], 3)
+
+    @number("3.8")
+    def test_tombstones(self):
+        # Disable resizing / rehashing.
+        dt = DoubleKeyTable(sizes=[12], internal_sizes=[5])
+        dt.hash1 = lambda k: ord(k[0]) % 12
+        dt.hash2 = lambda k, sub_table: ord(k[-1]) % 5
+
+        dt["Tim", "Jen"] = 1
+        dt["Het", "Liz"] = 2
+        self.assertEqual(dt._linear_probe("Het", "Liz", False), (1, 2))
+        del dt["Tim", "Jen"]
+        # Het is still found past the deleted slot in its cluster.
+        self.assertEqual(dt["Het", "Liz"], 2)
+        self.assertEqual(dt._linear_probe("Het", "Liz", False), (1, 2))
+        self.assertRaises(KeyError, lambda: dt["Tim", "Jen"])
+        # A new key reuses the deleted slot instead of going past Het.
+        dt["Tom", "Bob"] = 3
+        self.assertEqual(dt._linear_probe("Tom", "Bob", False), (0, 3))
+        self.assertEqual(dt.tombstone_count, 0)
+
+        # Rebuilt without growing once keys and tombstones pass 70% of the slots.
+        dt = DoubleKeyTable(sizes=[12], internal_sizes=[5])
+        dt.hash1 = lambda k: ord(k[0]) % 12
+        for first in "ABCDEF":
+            dt[first + "my", "Ben"] = 1
+        for first in "ABCDE":
+            del dt[first + "my", "Ben"]
+        dt["Gus", "Ben"] = 2
+        dt["Hal", "Ben"] = 3
+        self.assertEqual(dt.tombstone_count, 5)
+        dt["Ivy", "Ben"] = 4
+        self.assertEqual(dt.tombstone_count, 0)
+        self.assertEqual(dt.table_size, 12)
+        self.assertEqual(set(dt.keys()), {"Fmy", "Gus", "Hal", "Ivy"})
+        self.assertEqual(dt["Ivy", "Ben"], 4)
+
+        # Deleting and inserting different keys never fills every slot.
+        dt = DoubleKeyTable(sizes=[12], internal_sizes=[5])
+        dt.hash1 = lambda k: ord(k[0]) % 12
+        for i in range(33):
+            key = chr(ord("A") + i) + "ny"
+            dt[key, "Ben"] = i
+            del dt[key, "Ben"]
+            self.assertIn(None, dt.top_keys)
+        self.assertEqual(len(dt), 0)
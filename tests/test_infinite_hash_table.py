@@ -67,3 +67,47 @@ class TestInfiniteHash(unittest.TestCase):
         ih["lin"] = 10
         self.assertEqual(ih.get_location("lin"), [4])
         self.assertEqual(len(ih), 1)
+
+    @number("4.3")
+    def test_overwrite(self):
+        ih = InfiniteHashTable()
+        ih["lin"] = 1
+        ih["leg"] = 2
+        ih["lin"] = 3
+        self.assertEqual(ih["lin"], 3)
+        self.assertEqual(ih["leg"], 2)
+        self.assertEqual(ih.get_location("lin"), [4, 1])
+        self.assertEqual(len(ih), 2)
+
+    @number("4.4")
+    def test_missing_on_path(self):
+        ih = InfiniteHashTable()
+        ih["lin"] = 1
+        ih["leg"] = 2
+        # "lid" follows the same positions as "lin" but is not stored.
+        self.assertRaises(KeyError, lambda: ih["lid"])
+        self.assertRaises(KeyError, lambda: ih.get_location("lid"))
+        self.assertNotIn("lid", ih)
+        with self.assertRaises(KeyError):
+            del ih["lid"]
+        self.assertEqual(len(ih), 2)
+
+    @number("4.5")
+    def test_same_positions(self):
+        ih = InfiniteHashTable()
+        ih["a"] = 1
+        # ord("a") % 26 == ord("G") % 26, and both run out after one level.
+        with self.assertRaises(ValueError):
+            ih["G"] = 2
+        # The table is left as it was.
+        self.assertEqual(ih["a"], 1)
+        self.assertEqual(ih.get_location("a"), [19])
+        self.assertNotIn("G", ih)
+        self.assertEqual(len(ih), 1)
+
+        ih["ab"] = 3
+        # "a" now sits one level down, and "G" collides with it there.
+        with self.assertRaises(ValueError):
+            ih["G"] = 2
+        self.assertEqual(ih.get_location("a"), [19, 26])
+        self.assertEqual(len(ih), 2)
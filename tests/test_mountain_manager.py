@@ -1,4 +1,5 @@
 import unittest
+from copy import copy
 from ed_utils.decorators import number
 
 from mountain import Mountain
@@ -56,3 +57,45 @@ class TestInfiniteHash(unittest.TestCase):
         self.assertEqual(len(res), 4)
 
         self.assertEqual(make_set(res[3]), make_set([m10]))
+
+    @number("5.2")
+    def test_edit_in_place(self):
+        m1 = Mountain("m1", 2, 2)
+        m2 = Mountain("m2", 3, 9)
+
+        mm = MountainManager()
+        mm.add_mountain(m1)
+        mm.add_mountain(m2)
+
+        # The editor changes the stored mountain itself, then calls edit_mountain.
+        m1.difficulty_level = 5
+        mm.edit_mountain(m1, m1)
+        self.assertEqual([id(x) for x in mm.mountains_with_difficulty(5)], [id(m1)])
+        self.assertEqual(mm.mountains_with_difficulty(2), [])
+
+        # Changed without edit_mountain, removing still uses the group it was added to.
+        m2.difficulty_level = 7
+        mm.remove_mountain(m2)
+        self.assertEqual(mm.mountains_with_difficulty(3), [])
+        self.assertEqual([id(x) for x in mm.mountains], [id(m1)])
+        self.assertEqual(len(mm.group_by_difficulty()), 1)
+
+    @number("5.3")
+    def test_edit_with_copy(self):
+        m1 = Mountain("m1", 2, 2)
+
+        mm = MountainManager()
+        mm.add_mountain(m1)
+        self.assertRaises(ValueError, lambda: mm.add_mountain(m1))
+
+        # Saving in the editor passes a copy of the old values and the edited mountain.
+        old = copy(m1)
+        mm.edit_mountain(old, m1)
+        m1.difficulty_level = 4
+        mm.edit_mountain(old, m1)
+        self.assertEqual([id(x) for x in mm.mountains_with_difficulty(4)], [id(m1)])
+
+        # An equal mountain can be removed like list.remove would.
+        mm.remove_mountain(Mountain("m1", 4, 2))
+        self.assertEqual(mm.mountains, [])
+        self.assertRaises(ValueError, lambda: mm.remove_mountain(m1))
@@ -112,3 +112,16 @@ class TestTrailMethods(unittest.TestCase):
         self.assertIsInstance(res, TrailSeries)
         self.assertEqual(res.mountain, m)
         self.assertEqual(res.following.store, None)
+
+    @number("1.5")
+    def test_from_mountains(self):
+        a, b, c = (Mountain(letter, 5, 5) for letter in "abc")
+
+        res = Trail.from_mountains([a, b, c])
+        self.assertIsInstance(res, Trail)
+        self.assertEqual(res.collect_all_mountains(), [a, b, c])
+        self.assertIsInstance(res.store, TrailSeries)
+        self.assertEqual(res.store.mountain, a)
+        self.assertEqual(res.store.following.store.following.store.following.store, None)
+
+        self.assertEqual(Trail.from_mountains([]).store, None)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
+from typing import List, Iterator, Iterable
 from mountain import Mountain
-from data_structures.linked_stack import LinkedStack
 
 from typing import TYPE_CHECKING, Union
 
@@ -10,7 +9,7 @@ from typing import TYPE_CHECKING, Union
 if TYPE_CHECKING:
     from personality import WalkerPersonality
 
-@dataclass
+@dataclass(eq=False)
 class TrailSplit:
     """
     A split in the trail.
@@ -20,6 +19,9 @@ class TrailSplit:
       \__path_bottom__/
     """
 
+    #checked by the traversal loops instead of isinstance, TrailSeries is 0
+    KIND = 1
+
     path_top: Trail
     path_bottom: Trail
     path_follow: Trail
@@ -29,7 +31,7 @@ class TrailSplit:
         return self.path_follow.store
 
 
-@dataclass
+@dataclass(eq=False)
 class TrailSeries:
     """
     A mountain, followed by the rest of the trail
@@ -38,6 +40,9 @@ class TrailSeries:
 
     """
 
+    #traversal tag, see TrailSplit.KIND
+    KIND = 0
+
     mountain: Mountain
     following: Trail
 
@@ -63,11 +68,23 @@ class TrailSeries:
 
 TrailStore = Union[TrailSplit, TrailSeries, None]
 
-@dataclass
+@dataclass(eq=False)
 class Trail:
 
     store: TrailStore = None
 
+    @classmethod
+    def from_mountains(cls, mountains: Iterable[Mountain]) -> Trail:
+        """
+        Builds a trail of the given mountains in series, in the order given.
+        Use this instead of calling add_mountain_before in a loop.
+        Complexity best/worst: O(n) where n is the number of mountains.
+        """
+        trail = cls(None)
+        for mountain in reversed(list(mountains)):
+            trail = cls(TrailSeries(mountain, trail))
+        return trail
+
     def add_mountain_before(self, mountain: Mountain) -> Trail:
         """
         Adds a mountain before everything currently in the trail.
@@ -115,63 +132,77 @@ class Trail:
         """
         #get current store
         current_trail = self.store
-        #create a linked stack
-        trail_splits = LinkedStack()
+        #stack of TrailSplits passed, a list avoids allocating a node per push
+        trail_splits = []
+        #bind methods to locals, the loop runs once per trail store
+        push = trail_splits.append
+        pop = trail_splits.pop
+        add_mountain = personality.add_mountain
+        select_branch = personality.select_branch
 
         while True:
-            #if type is TrailSeries add mountain
-            if type(current_trail) == TrailSeries:
-                personality.add_mountain(current_trail.mountain)
+            #add a straight run of mountains without going back to the stack
+            while current_trail is not None and current_trail.KIND == 0:
+                add_mountain(current_trail.mountain)
                 current_trail = current_trail.following.store
-            #if trail series is not None go though the following
-            #paths in the TrailSplits that have been passed
+            #end of a path, continue with the following path of the last TrailSplit passed
             if current_trail is None:
-                if len(trail_splits) > 0:
-                    current_trail = trail_splits.pop()
-                    if current_trail is not None:
-                        current_trail = current_trail.path_follow.store
-                else:
+                if not trail_splits:
                     return
-            #if type is TrailSplit get next trail
-            if type(current_trail) == TrailSplit:
-                if personality.select_branch(current_trail.path_top, current_trail.path_bottom):
-                    trail_splits.push(current_trail)
+                current_trail = pop().path_follow.store
+            #TrailSplit, remember it and go down the selected branch
+            else:
+                push(current_trail)
+                if select_branch(current_trail.path_top, current_trail.path_bottom):
                     current_trail = current_trail.path_top.store
                 else:
-                    trail_splits.push(current_trail)
                     current_trail = current_trail.path_bottom.store
 
     def collect_all_mountains(self) -> list[Mountain]:
-        mountains = []
-        current = self.store
-
-        while current is not None:
-            if isinstance(current, TrailSeries):
-                mountains.append(current.mountain)
-                current = current.following
-            elif isinstance(current, TrailSplit):
-                mountains.extend(current.path_top.collect_all_mountains())
-                mountains.extend(current.path_bottom.collect_all_mountains())
-                current = current.path_follow
-            else:
-                current = None
+        """
+        Returns a list of every mountain in the trail, top branches before bottom branches.
+        Complexity best/worst: O(n) where n is the number of trail stores.
+        """
+        return list(self.iter_mountains())
 
-        return mountains
+    def iter_mountains(self) -> Iterator[Mountain]:
+        """
+        Generator that yields every mountain in the trail in the same order as
+        collect_all_mountains, without building the list.
+        Complexity best/worst: O(n) over the whole iteration, where n is the number of trail stores.
+        """
+        #stores still to visit, a TrailSplit pushes its parts in reverse so the top is popped first
+        stack = [self.store]
+
+        while stack:
+            current = stack.pop()
+            while current is not None:
+                if current.KIND == 0:
+                    yield current.mountain
+                    current = current.following.store
+                else:
+                    stack.append(current.path_follow.store)
+                    stack.append(current.path_bottom.store)
+                    current = current.path_top.store
 
-    def collect_all_starts(self) -> list[trail]:
+    def collect_all_starts(self) -> list[TrailSeries]:
+        """
+        Returns a list of every TrailSeries in the trail, top branches before bottom branches.
+        Complexity best/worst: O(n) where n is the number of trail stores.
+        """
         trails = []
-        current = self.store
-
-        while current is not None:
-            if isinstance(current, TrailSeries):
-                trails.append(current)
-                current = current.following.store
-            elif isinstance(current, TrailSplit):
-                trails.extend(current.path_top.collect_all_starts())
-                trails.extend(current.path_bottom.collect_all_starts())
-                current = current.path_follow.store
-            else:
-                current = None
+        stack = [self.store]
+
+        while stack:
+            current = stack.pop()
+            while current is not None:
+                if current.KIND == 0:
+                    trails.append(current)
+                    current = current.following.store
+                else:
+                    stack.append(current.path_follow.store)
+                    stack.append(current.path_bottom.store)
+                    current = current.path_top.store
 
         return trails
 
@@ -182,44 +213,48 @@ class Trail:
         Paths are represented as lists of mountains.
 
         Paths are unique if they take a different branch, even if this results in the same set of mountains.
+
+        Complexity best/worst: O(P + R * k) where P is the number of paths of at most k mountains
+        and R is the number of paths returned, paths are dropped as soon as they pass k mountains.
         """
+        return list(self._iter_paths(k))
 
-        current_trail = self.store
-        paths = self.findpath(current_trail)
-        result = [sub_list for sub_list in paths if len(sub_list) == k]
-        return paths
-
-
-
-
-    def findpath(self, current_trail) -> []:
-        path = []
-
-        if isinstance(current_trail, TrailSeries):
-            path.append(current_trail.mountain.name)
-            if (current_trail.following.store is not None):
-                path.extend(self.findpath(current_trail.following.store))
-        elif isinstance(current_trail, TrailSplit):
-            top_path = []
-            bot_path = []
-            if (current_trail.path_top.store is not None):
-                top_path.extend(self.findpath(current_trail.path_top.store))
-                if (current_trail.path_follow.store is not None):
-                    if isinstance(top_path[0],list):
-                        for i in top_path:
-                            i.extend(self.findpath(current_trail.path_follow.store))
-                    else:
-                        top_path.extend(self.findpath(current_trail.path_follow.store))
-                path.append(top_path)
-            if (current_trail.path_bottom.store is not None):
-                bot_path.extend(self.findpath(current_trail.path_bottom.store))
-                if (current_trail.path_follow.store is not None):
-                    bot_path.extend(self.findpath(current_trail.path_follow.store))
-                path.append(bot_path)
-        else:
-            path.append(current_trail.store)
-
-        return path
+    def _iter_paths(self, k: int) -> Iterator[list[Mountain]]:
+        """
+        Generator that yields every path through the trail with exactly k mountains.
+
+        Walks the trail with an explicit stack. Each frame holds the store to continue from,
+        the following trails still to walk once the current branch ends, and the mountains
+        so far as a linked (mountain, previous) pair so branches share their common prefix.
+        """
+        #(store, follows, prefix, length)
+        stack = [(self.store, None, None, 0)]
+        while stack:
+            store, follows, prefix, length = stack.pop()
+            while True:
+                #end of a branch, continue with the following trail of the last split
+                if store is None:
+                    if follows is None:
+                        #only paths of exactly k mountains are turned into lists
+                        if length == k:
+                            path = [None] * k
+                            for i in range(k - 1, -1, -1):
+                                path[i], prefix = prefix
+                            yield path
+                        break
+                    store, follows = follows
+                #mountain, stop this path once it has too many mountains
+                elif store.KIND == 0:
+                    length += 1
+                    if length > k:
+                        break
+                    prefix = (store.mountain, prefix)
+                    store = store.following.store
+                #TrailSplit, walk the top branch now and the bottom branch later
+                else:
+                    follows = (store.path_follow.store, follows)
+                    stack.append((store.path_bottom.store, follows, prefix, length))
+                    store = store.path_top.store
 
 
 if __name__ == '__main__':